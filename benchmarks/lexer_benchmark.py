@@ -0,0 +1,105 @@
+"""Compares the tokenizing throughput of the character-at-a-time `Lexer` with the
+master-regex `RegexLexer` on the same inputs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/lexer_benchmark.py [--repeat N] [FILE ...]
+
+With no files, a synthetic Harbour source is built by repeating `SAMPLE`.
+"""
+
+import time
+from argparse import ArgumentParser
+
+from harpy.lexer import Lexer, RegexLexer, Token, TokenType
+
+SAMPLE = """#include "inkey.ch"
+#define MAX_ITEMS 100
+
+/* Computes the total of an array of line items,
+ * skipping any that have been voided.
+ */
+static function LineTotal(aItems, nTax)
+
+    local nTotal := 0
+    local nIdx := 1
+    local cName := "Total"
+    local hTotals := { "net" => 0, "gross" => 0.0 }
+    local bSum := { |a, b| a + b }
+
+    while nIdx <= Len(aItems) .and. !lVoided
+        // Accumulate the net amount.
+        nTotal := nTotal + aItems[nIdx] * (1 + nTax / 100)
+        if nTotal >= 0xFFFF .or. nTotal < -1
+            nTotal := iif(lClamp, 0xFFFF, nTotal)
+        elseif nTotal == 12.5
+            cName := [Half] + ' ' + cName
+        endif
+        nIdx := nIdx + 1
+    end while
+
+return nTotal
+
+"""
+
+
+def tokenize(lexer: Lexer) -> list[Token]:
+    tokens = []
+    for token in lexer:
+        if token.type == TokenType.EOF:
+            return tokens
+        tokens.append(token)
+
+
+def bench(engine: type[Lexer], text: str, repeat: int) -> tuple[float, list[Token]]:
+    best = float("inf")
+    tokens = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = tokenize(engine(text=text))
+        best = min(best, time.perf_counter() - start)
+
+    return best, tokens
+
+
+def main():
+    argparse = ArgumentParser(description="Lexer throughput benchmark")
+    argparse.add_argument("files", nargs="*", help="Harbour sources to tokenize")
+    argparse.add_argument(
+        "--repeat", type=int, default=5, help="runs per engine, best is reported"
+    )
+    argparse.add_argument(
+        "--copies",
+        type=int,
+        default=2000,
+        help="copies of the built-in sample to tokenize when no files are given",
+    )
+    args = argparse.parse_args()
+
+    inputs = []
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as infile:
+            inputs.append((path, infile.read()))
+    if len(inputs) == 0:
+        inputs.append((f"sample x {args.copies}", SAMPLE * args.copies))
+
+    for name, text in inputs:
+        print(f"{name}: {len(text)} characters")
+        baseline = None
+        streams = []
+        for engine in (Lexer, RegexLexer):
+            elapsed, tokens = bench(engine=engine, text=text, repeat=args.repeat)
+            streams.append(tokens)
+            rate = len(tokens) / elapsed
+            speedup = "" if baseline is None else f" ({rate / baseline:.2f}x)"
+            baseline = baseline or rate
+            print(
+                f"  {engine.__name__:<12} {len(tokens):>9} tokens "
+                f"{elapsed:8.3f}s {rate:>12,.0f} tokens/s{speedup}"
+            )
+
+        if str(streams[0]) != str(streams[1]):
+            print("  WARNING: token streams differ between engines")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from .ast import Comment
-from .lexer import Lexer, SourceReader, Token, TokenType
+from .lexer import Lexer, RegexLexer, SourceReader, Token, TokenType
 from .parser import ExpressionParser, Parser
 
 __all__ = [
@@ -7,6 +7,7 @@ __all__ = [
     "ExpressionParser",
     "Parser",
     "Lexer",
+    "RegexLexer",
     "SourceReader",
     "Token",
     "TokenType",
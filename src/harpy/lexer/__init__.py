@@ -1,11 +1,15 @@
 from .lexer import Lexer
+from .regex_lexer import RegexLexer
 from .source_reader import SourceReader
+from .symbol_table import SymbolTable
 from .token import Token
 from .token_type import TokenType
 
 __all__ = [
     "Lexer",
+    "RegexLexer",
     "SourceReader",
+    "SymbolTable",
     "Token",
     "TokenType",
 ]
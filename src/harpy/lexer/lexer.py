@@ -1,3 +1,4 @@
+from .symbol_table import SymbolTable
 from .token import Token
 from .token_type import TokenType
 
@@ -17,7 +18,7 @@ class Lexer:
     _keywords: dict[str, TokenType]
     _simple_operators: dict[str, TokenType]
     _compound_operatos: dict[str, TokenType]
-    _names: list[str]
+    _symbols: SymbolTable
     _line: int
     _pos: int
     _reset_index: int
@@ -34,7 +35,7 @@ class Lexer:
         self._keywords = {}
         self._compound_operators = {}
         self._simple_operators = {}
-        self._names = []
+        self._symbols = SymbolTable()
         self._line = 1
         self._index = 0
         self._pos = 0
@@ -64,6 +65,12 @@ class Lexer:
     def __iter__(self):
         return self
 
+    def symbols(self) -> SymbolTable:
+        """Returns the table of identifiers read so far, which later passes can
+        reuse instead of rescanning the source.
+        """
+        return self._symbols
+
     def __next__(self):
         while self._index < len(self._text):
             c = self._advance()
@@ -78,6 +85,14 @@ class Lexer:
                             return self._read_line_comment()
                         case "*":
                             return self._read_block_comment()
+                        case "=":
+                            self._advance()
+                            return Token(
+                                type=TokenType.DIVEQ,
+                                text="/=",
+                                line=self._line,
+                                position=self._pos,
+                            )
                         case _:
                             return Token(
                                 type=self._simple_operators[c],
@@ -315,7 +330,7 @@ class Lexer:
 
         # TODO: This won't work unless we handle include files/preprocessor parsing first,
         # e.g., `IF !(aHWFlag[F_HWCardReader] .OR. aHWFlag[F_HWDallasKey]) .OR. oPOSStatus:oFree:lFlag3`
-        if endquote == "]" and literal[1:] in self._names:
+        if endquote == "]" and literal[1:] in self._symbols:
             self._reset()
             return Token(
                 type=TokenType.LEFT_BRACKET,
@@ -358,9 +373,7 @@ class Lexer:
                 break
             self._advance()
 
-        name = self._text[start_index : self._index]
-
-        self._names.append(name)
+        name = self._symbols.add(self._text[start_index : self._index])
 
         return Token(
             type=TokenType.NAME, text=name, line=self._line, position=self._pos
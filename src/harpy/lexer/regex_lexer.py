@@ -0,0 +1,192 @@
+import re
+
+from .lexer import Lexer
+from .token import Token
+from .token_type import TokenType
+
+
+def _operator_pattern() -> str:
+    operators = [
+        type.compound_operator()
+        for type in TokenType
+        if type.compound_operator() is not None
+        and type not in (TokenType.AND, TokenType.OR)
+    ]
+    operators += [
+        type.simple_operator()
+        for type in TokenType
+        if type.simple_operator() is not None
+    ]
+
+    # Longest first, so that e.g. `:=` wins over `:`.
+    operators.sort(key=len, reverse=True)
+
+    return "|".join(re.escape(operator) for operator in operators)
+
+
+class RegexLexer(Lexer):
+    """An alternative scanning engine for the Lexer. Rather than walking the source
+    one character at a time, a single compiled master regex matches whole lexemes
+    which are then sliced out of the source text. The Token stream produced is the
+    same as the one produced by `Lexer`, so the two can be used interchangeably,
+    e.g., `Parser(lexer=RegexLexer(text=text))`.
+    """
+
+    _PATTERN = re.compile(
+        r"[ \t\r\f\v]*(?:"
+        r"(?P<name>[^\W\d_]\w*)"
+        r"|(?P<newline>\n)"
+        r"|(?P<string>\"[^\"]*\"|'[^']*')"
+        r"|(?P<line_comment>//[^\r\n]*)"
+        r"|(?P<block_comment>/\*.*?\*/)"
+        r"|(?P<bracket>\[(?P<bracket_text>[^\W\d_][^\]]*)\])"
+        r"|(?P<directive>\#(?P<directive_name>[^\W\d_]*)[^\r\n]*)"
+        r"|(?P<unterminated>[\"']|/\*|\[(?=[^\W\d_]))"
+        rf"|(?P<operator>{_operator_pattern()})"
+        r"|(?P<number>0[xX][0-9A-Fa-f]*|[0-9]+(?:\.[0-9]*)?|\.[0-9]*(?![^\W\d_]))"
+        r"|(?P<logical>\.[^.]*\.?)"
+        r"|(?P<other>.)"
+        r")",
+        re.DOTALL,
+    )
+
+    _line_start: int
+
+    def __init__(self, text: str):
+        """Creates a new RegexLexer to tokenize the given string.
+
+        Args:
+            text (str): String to tokenize.
+        """
+
+        super().__init__(text=text)
+
+        self._line_start = 0
+
+    def __next__(self):
+        text = self._text
+        scan = self._PATTERN.match
+
+        while (m := scan(text, self._index)) is not None:
+            kind = m.lastgroup
+            start = m.start(kind)
+            self._index = end = m.end()
+
+            match kind:
+                case "name":
+                    name = m.group(kind)
+                    if (kw := self._keywords.get(name.lower())) is not None:
+                        return self._token(type=kw, text=name, end=end)
+
+                    return self._token(
+                        type=TokenType.NAME, text=self._symbols.add(name), end=end
+                    )
+                case "operator":
+                    operator = m.group(kind)
+                    if (op := self._simple_operators.get(operator)) is None:
+                        op = self._compound_operators[operator]
+                    return self._token(type=op, text=operator, end=end)
+                case "newline":
+                    self._line += 1
+                    self._line_start = end
+                case "number":
+                    return self._num_literal(m.group(kind), end=end)
+                case "string":
+                    return self._multiline(
+                        type=TokenType.STR_LITERAL, start=start, end=end
+                    )
+                case "bracket":
+                    if m.group("bracket_text") in self._symbols:
+                        self._index = start + 1
+                        return self._token(
+                            type=TokenType.LEFT_BRACKET, text="[", end=start + 1
+                        )
+                    return self._multiline(
+                        type=TokenType.STR_LITERAL, start=start, end=end
+                    )
+                case "line_comment":
+                    return self._token(
+                        type=TokenType.LINE_COMMENT, text=m.group(kind), end=end
+                    )
+                case "block_comment":
+                    return self._multiline(
+                        type=TokenType.BLOCK_COMMENT, start=start, end=end
+                    )
+                case "directive":
+                    directive = m.group("directive_name").lower()
+                    if directive in self._directives:
+                        return self._token(
+                            type=self._directives[directive],
+                            text=m.group(kind),
+                            end=end,
+                        )
+                    self._index = start + 1
+                    return self._token(type=TokenType.NE1, text="#", end=start + 1)
+                case "logical":
+                    return self._bool_literal_or_logical(m.group(kind), end=end)
+                case "unterminated":
+                    if m.group(kind) == "/*":
+                        raise SyntaxError("Unterminated block comment.")
+                    raise SyntaxError(
+                        f"Unterminated string literal '{text[start : len(text)]}'."
+                    )
+                case _:
+                    # Ignore all other characters (whitespace, etc.)
+                    pass
+
+        # Once we've reached the end of the string, just return EOF tokens. We'll
+        # just keep returning them as many times as we're asked so that the
+        # parser's lookahead doesn't have to worry about running out of tokens.
+        return Token(
+            type=TokenType.EOF,
+            text="\0",
+            line=self._line,
+            position=self._index - self._line_start,
+        )
+
+    def _token(self, type: TokenType, text: str, end: int) -> Token:
+        return Token(
+            type=type, text=text, line=self._line, position=end - self._line_start
+        )
+
+    def _multiline(self, type: TokenType, start: int, end: int) -> Token:
+        line = self._line
+        newlines = self._text.count("\n", start, end)
+        if newlines > 0:
+            self._line += newlines
+            self._line_start = self._text.rfind("\n", start, end) + 1
+
+        return Token(
+            type=type,
+            text=self._text[start:end],
+            line=line,
+            position=end - self._line_start,
+        )
+
+    def _num_literal(self, literal: str, end: int) -> Token:
+        c = self._text[end : end + 1]
+        match c.lower():
+            case "x":
+                raise SyntaxError(f"Unterminated hexadecimal literal '{literal + c}'.")
+            case "a" | "b" | "c" | "d" | "e" | "f":
+                raise SyntaxError(f"Invalid numeric literal '{literal + c}'.")
+            case ".":
+                raise SyntaxError(
+                    f"Second decimal point found in literal '{literal + c}'."
+                )
+
+        return self._token(type=TokenType.NUM_LITERAL, text=literal, end=end)
+
+    def _bool_literal_or_logical(self, literal: str, end: int) -> Token:
+        if literal.count(".") < 2:
+            literal += "."
+
+        match literal.lower():
+            case ".t." | ".f.":
+                return self._token(type=TokenType.BOOL_LITERAL, text=literal, end=end)
+            case ".or.":
+                return self._token(type=TokenType.OR, text=literal, end=end)
+            case ".and.":
+                return self._token(type=TokenType.AND, text=literal, end=end)
+            case _:
+                raise SyntaxError(f"Unable to read token '{literal}'.")
@@ -0,0 +1,34 @@
+from collections.abc import Iterator
+
+
+class SymbolTable:
+    """The table of identifiers seen by a Lexer, in the order in which they were
+    first seen. Each distinct name is stored once, so lookups are constant time and
+    every occurrence of a name shares the same string instance.
+    """
+
+    _symbols: dict[str, str]
+
+    def __init__(self):
+        self._symbols = {}
+
+    def add(self, name: str) -> str:
+        """Adds a name to the table if it is not already present.
+
+        Args:
+            name (str): Identifier to add.
+
+        Returns:
+            str: The shared instance of the name held by the table.
+        """
+
+        return self._symbols.setdefault(name, name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
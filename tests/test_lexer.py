@@ -1,6 +1,6 @@
 import pytest
 
-from harpy import Lexer, Token, TokenType
+from harpy import Lexer, RegexLexer, Token, TokenType
 
 
 class TestLexer:
@@ -273,6 +273,25 @@ class TestLexer:
 
         assert str(obs) == str(expected)
 
+    def test_compound_assignment(self):
+        obs = self._get_obs(source="a /= b")
+        expected = [
+            Token(type=TokenType.NAME, text="a", line=1, position=1),
+            Token(type=TokenType.DIVEQ, text="/=", line=1, position=4),
+            Token(type=TokenType.NAME, text="b", line=1, position=6),
+        ]
+
+        assert str(obs) == str(expected)
+
+        obs = self._get_obs(source="a *= b")
+        expected = [
+            Token(type=TokenType.NAME, text="a", line=1, position=1),
+            Token(type=TokenType.MULTEQ, text="*=", line=1, position=4),
+            Token(type=TokenType.NAME, text="b", line=1, position=6),
+        ]
+
+        assert str(obs) == str(expected)
+
     def test_line_comment(self):
         obs = self._get_obs(source="// This is a line comment.")
         expected = [
@@ -423,8 +442,26 @@ class TestLexer:
 
         assert str(obs) == str(expected)
 
+    def test_symbols(self):
+        lexer = self._get_lexer(
+            source="function a(b)\n    local c := b[c]\nreturn a(b)"
+        )
+        obs = [token for token in self._tokenize(lexer) if token.type == TokenType.NAME]
+        symbols = lexer.symbols()
+
+        assert list(symbols) == ["a", "b", "c"]
+        assert len(symbols) == 3
+        assert "b" in symbols
+        assert "function" not in symbols
+        assert obs[0].text is obs[-2].text
+
+    def _get_lexer(self, source: str) -> Lexer:
+        return Lexer(text=source)
+
     def _get_obs(self, source: str) -> list[Token]:
-        lexer = Lexer(text=source)
+        return self._tokenize(self._get_lexer(source=source))
+
+    def _tokenize(self, lexer: Lexer) -> list[Token]:
         obs = []
         for token in lexer:
             if token.type == TokenType.EOF:
@@ -433,3 +470,19 @@ class TestLexer:
                 obs.append(token)
 
         return obs
+
+
+class TestRegexLexer(TestLexer):
+    """Runs the `TestLexer` cases against the regex scanning engine, which must
+    produce the same Token stream.
+    """
+
+    def test_multiline_positions(self):
+        source = "function a()\n/* one\n * two */ b := 1\nreturn b"
+
+        assert str(self._get_obs(source=source)) == str(
+            self._tokenize(Lexer(text=source))
+        )
+
+    def _get_lexer(self, source: str) -> Lexer:
+        return RegexLexer(text=source)